@@ -1,36 +1,69 @@
 """Common adapter logic: load context.json (read-only), build payload from declaration, copy files, write context.json."""
 
-import json
+import errno
+import io
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+from .. import jsonio
+from ..manifest import cached_file_checksum
 
 if TYPE_CHECKING:
     from ..document import Document
 
 
+@lru_cache(maxsize=16)
 def load_adapter_spec(root: Path, adapter_name: str) -> Dict[str, Any]:
-    """Load ai_context/adapters/<name>/context.json (read-only). Raises FileNotFoundError if missing. Requires output_dir."""
+    """
+    Load ai_context/adapters/<name>/context.json (read-only). Raises FileNotFoundError if missing. Requires output_dir.
+    Memoized per (root, adapter_name) for the process; callers must not mutate the result.
+    Use load_adapter_spec.cache_clear() to force a re-read.
+    """
     spec_path = root / "adapters" / adapter_name / "context.json"
     if not spec_path.exists():
         raise FileNotFoundError(f"Adapter spec not found: {spec_path}")
-    with open(spec_path, encoding="utf-8") as f:
-        spec = json.load(f)
+    spec = jsonio.load(spec_path)
     if not spec.get("output_dir"):
         raise ValueError(f"Adapter spec must contain output_dir: {spec_path}")
     return spec
 
 
+# Process-wide checksum cache for adapter payloads (path -> size, mtime_ns, checksum), as in manifest's cache.
+_CHECKSUM_CACHE: Dict[str, Dict[str, Any]] = {}
+_CHECKSUM_CACHE_MAX = 4096
+
+
+def _cached_checksum(path: Path) -> str:
+    """file_checksum of path, reusing a cached result while size and mtime_ns are unchanged."""
+    if len(_CHECKSUM_CACHE) >= _CHECKSUM_CACHE_MAX:
+        _CHECKSUM_CACHE.clear()
+    return cached_file_checksum(path, os.stat(path), _CHECKSUM_CACHE)
+
+
+def _lexical_path(path: Path) -> Path:
+    """Absolute, normalized path without touching the filesystem (no per-component realpath walk)."""
+    return Path(os.path.abspath(path))
+
+
 def _index_by_path(index: Dict[str, "Document"], root: Path) -> Dict[Path, "Document"]:
-    """Build path -> Document map (resolved paths) for lookup by source path."""
-    by_path: Dict[Path, "Document"] = {}
+    """Build path -> Document map (lexically normalized paths) for lookup by source path."""
+    return {_lexical_path(doc.path): doc for doc in index.values()}
+
+
+def _index_by_real_path(index: Dict[str, "Document"]) -> Dict[Path, "Document"]:
+    """Build path -> Document map (resolved paths); the fallback when a source is reached through symlinks."""
+    by_real_path: Dict[Path, "Document"] = {}
     for doc in index.values():
         try:
-            resolved = doc.path.resolve()
-            by_path[resolved] = doc
-        except Exception:
+            by_real_path[doc.path.resolve()] = doc
+        except OSError:
             pass
-    return by_path
+    return by_real_path
 
 
 def build_payload(
@@ -43,41 +76,54 @@ def build_payload(
     Build payload from adapter declaration only. Documents list comes from spec["documents"].
     Validates that every source exists (fail fast). Enriches from index when document is indexed.
     """
-    from ..manifest import content_checksum
-
     output_dir = spec["output_dir"]
     declared = spec.get("documents") or []
     by_path = _index_by_path(index, root)
+    by_real_path: Optional[Dict[Path, "Document"]] = None
     documents = []
     for entry in declared:
         source = entry.get("source")
         if not source:
             raise ValueError(f"Adapter {adapter_name}: document entry missing 'source': {entry}")
-        src_path = (root / source).resolve()
+        # Checked as the kernel will open it for the copy (symlinks, then ".."), so a missing source fails before any copy.
+        src_path = root / source
         if not src_path.is_file():
             raise FileNotFoundError(f"Adapter {adapter_name}: source not found: {source}")
-        target = entry.get("target", source)
-        doc_entry = {
-            "id": entry.get("id", ""),
-            "kind": entry.get("kind", ""),
-            "source": source,
-            "target": target,
-        }
+        entry_id = entry.get("id", "")
         # Enrich from index if present
-        indexed = index.get(entry.get("id")) or by_path.get(src_path)
-        if indexed:
-            raw = indexed.path.read_text(encoding="utf-8")
-            doc_entry["version"] = indexed.version
-            doc_entry["status"] = getattr(indexed, "status", None)
-            doc_entry["complexity"] = getattr(indexed, "complexity", None)
-            doc_entry["checksum"] = content_checksum(raw)
-            doc_entry["tags"] = getattr(indexed, "tags", None) or []
+        indexed = index.get(entry_id) if entry_id else None
+        if indexed is None and ".." not in Path(source).parts:
+            # Lexical lookup is only sound without ".."; a symlinked directory before ".." changes the target.
+            indexed = by_path.get(_lexical_path(src_path))
+        if indexed is None:
+            # Symlinked file or directory on the way: compare real paths.
+            if by_real_path is None:
+                by_real_path = _index_by_real_path(index)
+            indexed = by_real_path.get(src_path.resolve())
+        if indexed is not None:
+            doc_entry = {
+                "id": entry_id,
+                "kind": entry.get("kind", ""),
+                "source": source,
+                "target": entry.get("target", source),
+                "version": indexed.version,
+                "status": indexed.status,
+                "complexity": indexed.complexity,
+                "checksum": _cached_checksum(indexed.path),
+                "tags": list(indexed.tags),
+            }
         else:
-            doc_entry["version"] = entry.get("version", 1)
-            doc_entry["status"] = None
-            doc_entry["complexity"] = None
-            doc_entry["checksum"] = None
-            doc_entry["tags"] = entry.get("tags", [])
+            doc_entry = {
+                "id": entry_id,
+                "kind": entry.get("kind", ""),
+                "source": source,
+                "target": entry.get("target", source),
+                "version": entry.get("version", 1),
+                "status": None,
+                "complexity": None,
+                "checksum": None,
+                "tags": entry.get("tags", []),
+            }
         documents.append(doc_entry)
     return {
         "output_dir": output_dir,
@@ -85,14 +131,106 @@ def build_payload(
     }
 
 
-def _copy_documents(root: Path, output_base: Path, output_dir: str, documents: list) -> None:
-    """Copy each document from root/source to output_base/output_dir/target. Sources from root."""
-    out_path = output_base / output_dir if not output_dir.startswith("/") else Path(output_dir)
-    for doc in documents:
-        src = root / doc["source"]
-        dst = out_path / doc["target"]
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
+_HAS_CFR = hasattr(os, "copy_file_range")
+_HAS_SENDFILE = hasattr(os, "sendfile")
+_COPY_CHUNK = 1 << 20
+_CFR_CHUNK = 1 << 30
+# Errors meaning "this kernel/filesystem pair cannot do it", not a real I/O failure.
+_FALLBACK_ERRNOS = frozenset({errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP, errno.ENOTSOCK})
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_COPY_WORKERS = 32
+
+
+def _copy_fd(in_fd: int, out_fd: int, regular: bool) -> None:
+    """Copy in_fd to out_fd from current offsets: copy_file_range, then sendfile, then a 1 MiB read loop."""
+    if regular and _HAS_CFR:
+        try:
+            while os.copy_file_range(in_fd, out_fd, _CFR_CHUNK) > 0:
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+    if regular and _HAS_SENDFILE:
+        try:
+            while os.sendfile(out_fd, in_fd, None, _COPY_CHUNK) > 0:
+                pass
+            return
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+    # Offsets advance together in the fast paths above, so a partial copy just continues here.
+    buf = bytearray(_COPY_CHUNK)
+    view = memoryview(buf)
+    src = io.FileIO(in_fd, "rb", closefd=False)
+    while True:
+        n = src.readinto(buf)
+        if not n:
+            break
+        written = 0
+        while written < n:
+            written += os.write(out_fd, view[written:n])
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy src to dst without routing bytes through Python when the kernel allows; keep mode and times like shutil.copy2."""
+    in_fd = os.open(src, os.O_RDONLY | _O_CLOEXEC | _O_BINARY)
+    try:
+        st = os.fstat(in_fd)
+        # O_TRUNC below would empty src if dst is the same file; refuse like shutil.copy2.
+        try:
+            dst_st = os.stat(dst)
+        except FileNotFoundError:
+            pass
+        else:
+            if (dst_st.st_dev, dst_st.st_ino) == (st.st_dev, st.st_ino):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_CLOEXEC | _O_BINARY, 0o666)
+        try:
+            _copy_fd(in_fd, out_fd, stat.S_ISREG(st.st_mode))
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _make_dirs(base: str, dirs: set) -> None:
+    """Create each directory once, shallowest first; only walk ancestors when the parent is not known to exist."""
+    created = {base}
+    for d in sorted(dirs, key=lambda p: p.count(os.sep)):
+        if d in created:
+            continue
+        if os.path.dirname(d) in created:
+            try:
+                os.mkdir(d)
+            except FileExistsError:
+                if not os.path.isdir(d):
+                    raise
+        else:
+            os.makedirs(d, exist_ok=True)
+        created.add(d)
+
+
+def _copy_documents(root: Path, out_path: Path, documents: list) -> None:
+    """Copy each document from root/source to out_path/target. Works on str paths to avoid a Path per file."""
+    str_root = os.fspath(root)
+    str_out = os.path.normpath(out_path)
+    # target -> source; a repeated target keeps the last declaration, as sequential copying did.
+    targets = {
+        os.path.normpath(os.path.join(str_out, doc["target"])): os.path.join(str_root, doc["source"])
+        for doc in documents
+    }
+    _make_dirs(str_out, {os.path.dirname(dst) for dst in targets})
+    if not targets:
+        return
+    # Copies are independent and release the GIL in the kernel calls; overlap them.
+    with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(targets))) as pool:
+        futures = [pool.submit(_fast_copy, src, dst) for dst, src in targets.items()]
+    for future in futures:
+        future.result()
 
 
 def run_export(
@@ -113,15 +251,11 @@ def run_export(
     output_base = project_root if project_root is not None else root
     out_path = output_base / output_dir if not output_dir.startswith("/") else Path(output_dir)
     out_path.mkdir(parents=True, exist_ok=True)
-    _copy_documents(root, output_base, output_dir, payload["documents"])
-    context_out = out_path / "context.json"
-    with open(context_out, "w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "output_dir": output_dir,
-                "documents": payload["documents"],
-            },
-            f,
-            indent=2,
-            ensure_ascii=False,
-        )
+    _copy_documents(root, out_path, payload["documents"])
+    jsonio.write(
+        out_path / "context.json",
+        {
+            "output_dir": output_dir,
+            "documents": payload["documents"],
+        },
+    )
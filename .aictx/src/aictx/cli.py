@@ -1,6 +1,6 @@
 """CLI: validate, build-manifest, list, diff, export."""
 
-import json
+import os
 import sys
 from pathlib import Path
 
@@ -14,13 +14,17 @@ from .config import (
     validate_context_root,
     validate_project_root,
 )
+from . import jsonio
 from .indexer import build_index
 from .validate import run_validate
 from .manifest import (
     build_manifest,
+    cached_file_checksum,
     write_manifest,
     save_state,
     load_last_manifest,
+    load_checksum_cache,
+    save_checksum_cache,
 )
 from .plugins import emit, load_plugins_from_dir
 from .document import Document
@@ -96,9 +100,17 @@ def build_manifest_cmd(ctx: click.Context) -> None:
             click.echo(e, err=True)
         sys.exit(1)
     emit("before_build_manifest", root=root, config=config, index=index)
-    manifest = build_manifest(root, index, config.get("convention_version", "0.0.1"))
+    checksum_cache = load_checksum_cache(aictx_dir)
+    try:
+        manifest = build_manifest(
+            root, index, config.get("convention_version", "0.0.1"), checksum_cache=checksum_cache
+        )
+    except ValueError as e:  # document body not valid UTF-8
+        click.echo(str(e), err=True)
+        sys.exit(1)
     write_manifest(root, manifest)
     save_state(aictx_dir, manifest)
+    save_checksum_cache(aictx_dir, checksum_cache)
     emit("after_build_manifest", root=root, config=config, manifest=manifest)
     click.echo(f"Built manifest: {len(manifest['documents'])} documents, active_set={len(manifest.get('active_set', []))}.")
 
@@ -118,29 +130,32 @@ def list_cmd(ctx: click.Context, status: str | None, kind: str | None, as_json:
         sys.exit(1)
     items = []
     for doc_id, doc in sorted(index.items()):
-        if status and getattr(doc, "status", None) != status:
+        if status and doc.status != status:
             continue
         if kind and doc.kind != kind:
             continue
-        rel = doc.path.relative_to(root) if root in doc.path.parents or doc.path == root else doc.path
         items.append({
             "id": doc_id,
             "kind": doc.kind,
-            "status": getattr(doc, "status", None),
-            "path": str(rel),
-            "complexity": getattr(doc, "complexity", None),
+            "status": doc.status,
+            "path": str(doc.rel_path or doc.path),
+            "complexity": doc.complexity,
         })
     if as_json:
-        click.echo(json.dumps(items, indent=2, ensure_ascii=False))
+        click.echo(jsonio.dumps(items))
         return
     if not items:
         click.echo("No documents match.")
         return
-    col = lambda k: max(len(str(row.get(k) or "")) for row in items) or 4
-    w_id, w_kind, w_status, w_path = max(col("id"), 2), max(col("kind"), 4), max(col("status"), 6), max(col("path"), 4)
-    click.echo(f"{'id':<{w_id}}  {'kind':<{w_kind}}  {'status':<{w_status}}  path")
+    # One pass for cell text and column widths (minimums are the header widths); path is unpadded.
+    rows = []
+    w_id, w_kind, w_status = 2, 4, 6
     for row in items:
-        click.echo(f"{str(row.get('id') or ''):<{w_id}}  {str(row.get('kind') or ''):<{w_kind}}  {str(row.get('status') or ''):<{w_status}}  {row.get('path') or ''}")
+        cells = (str(row["id"] or ""), str(row["kind"] or ""), str(row["status"] or ""), row["path"] or "")
+        w_id, w_kind, w_status = max(w_id, len(cells[0])), max(w_kind, len(cells[1])), max(w_status, len(cells[2]))
+        rows.append(cells)
+    fmt = f"{{:<{w_id}}}  {{:<{w_kind}}}  {{:<{w_status}}}  {{}}"
+    click.echo("\n".join([fmt.format("id", "kind", "status", "path")] + [fmt.format(*cells) for cells in rows]))
 
 
 @main.command()
@@ -158,24 +173,28 @@ def diff(ctx: click.Context, as_json: bool) -> None:
     if not last:
         click.echo("No previous manifest in state. Run build-manifest first.")
         sys.exit(0)
-    current_ids = set(index.keys())
-    last_ids = {d["id"] for d in last.get("documents", [])}
     last_checksums = {d["id"]: d.get("checksum") for d in last.get("documents", [])}
-    added = sorted(current_ids - last_ids)
-    removed = sorted(last_ids - current_ids)
+    # Checksums by path/size/mtime from the last build (cache only: when missing, every document is hashed).
+    checksum_cache = load_checksum_cache(aictx_dir)
+    added = []
+    common = []
+    for doc_id in sorted(index):
+        (common if doc_id in last_checksums else added).append(doc_id)
+    removed = sorted(last_checksums.keys() - index.keys())
     changed = []
-    for doc_id in sorted(current_ids & last_ids):
-        doc = index.get(doc_id)
-        if not doc:
-            continue
-        raw = doc.path.read_text(encoding="utf-8")
-        from .manifest import content_checksum
-        cs = content_checksum(raw)
+    for doc_id in common:
+        doc = index[doc_id]
+        try:
+            cs = cached_file_checksum(doc.path, os.stat(doc.path), checksum_cache)
+        except ValueError as e:  # document body not valid UTF-8
+            click.echo(str(e), err=True)
+            sys.exit(1)
         if last_checksums.get(doc_id) != cs:
             changed.append(doc_id)
     report = {"added": added, "removed": removed, "changed": changed}
     if as_json:
-        click.echo(json.dumps(report, indent=2))
+        # ASCII-escaped, as diff --json has always been (list --json keeps non-ASCII as-is)
+        click.echo(jsonio.dumps(report, ensure_ascii=True))
         return
     if added:
         click.echo("Added: " + ", ".join(added))
@@ -1,11 +1,17 @@
 """Load .aictx/config.yaml and resolve ai_context root."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 DEFAULT_CONVENTION_VERSION = "0.0.1"
 RELATION_TYPES = frozenset({"uses", "depends", "supersedes"})
 STATUS_VALUES = frozenset({"active", "historical", "obsolete"})
@@ -43,8 +49,13 @@ def validate_project_root(path: Path, check_writable: bool = True) -> None:
 
 
 def find_aictx_dir(start: Path) -> Optional[Path]:
-    """Walk upward from start until .aictx is found."""
-    current = start.resolve()
+    """Walk upward from start until .aictx is found. Results are memoized per resolved start."""
+    return _find_aictx_dir(os.fspath(Path(start).resolve()))
+
+
+@lru_cache(maxsize=64)
+def _find_aictx_dir(start: str) -> Optional[Path]:
+    current = Path(start)
     while True:
         if (current / ".aictx").is_dir():
             return current / ".aictx"
@@ -58,10 +69,16 @@ def find_ai_context_root(start: Path, explicit_root: Optional[Path] = None) -> P
     """
     Resolve ai_context root: explicit_root, or directory containing manifests.yaml
     or rules/ or tasks/, or cwd. Prefer walking up from start (cwd).
+    The upward walk is memoized per resolved start.
     """
     if explicit_root is not None:
         return Path(explicit_root).resolve()
-    current = start.resolve()
+    return _find_ai_context_root(os.fspath(Path(start).resolve()))
+
+
+@lru_cache(maxsize=64)
+def _find_ai_context_root(start: str) -> Path:
+    current = Path(start)
     while True:
         if (current / "manifests.yaml").exists():
             return current
@@ -69,10 +86,16 @@ def find_ai_context_root(start: Path, explicit_root: Optional[Path] = None) -> P
             return current
         parent = current.parent
         if parent == current:
-            return start.resolve()
+            return Path(start)
         current = parent
 
 
+def clear_root_caches() -> None:
+    """Forget memoized find_aictx_dir / find_ai_context_root results (e.g. after creating dirs in tests)."""
+    _find_aictx_dir.cache_clear()
+    _find_ai_context_root.cache_clear()
+
+
 def load_config(aictx_dir: Path) -> dict:
     """Load .aictx/config.yaml; return dict with convention_version, adapters, project_root."""
     config_path = aictx_dir / "config.yaml"
@@ -82,7 +105,7 @@ def load_config(aictx_dir: Path) -> dict:
             "adapters": ["cursor", "copilot"],
         }
     with open(config_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
     project_root_raw = data.get("project_root")
     project_root = None
     if project_root_raw is not None and str(project_root_raw).strip():
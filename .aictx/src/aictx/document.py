@@ -1,15 +1,28 @@
 """Document model: frontmatter parsing and schemas by kind."""
 
 import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 from .config import COMPLEXITY_VALUES, STATUS_VALUES
 
 FRONTMATTER_DELIM = "---"
+_READ_CHUNK = 4096
+_CLOSE_MARK = "\n" + FRONTMATTER_DELIM
+_EOL_RE = re.compile(r"\r\n?")
+# Opening ---, leading newlines (atomic, as lstrip would), frontmatter up to the first "\n---", rest after it.
+_FRONTMATTER_RE = re.compile(
+    rf"{FRONTMATTER_DELIM}(?=([\r\n]*))\1(.*?)\n{FRONTMATTER_DELIM}(.*)", re.DOTALL
+)
 
 
 @dataclass
@@ -24,20 +37,37 @@ class Document:
     complexity: Optional[str] = None
     tags: List[str] = field(default_factory=list)
     raw_frontmatter: Dict[str, Any] = field(default_factory=dict)
+    # Empty for documents from build_index, which reads frontmatter only; use read_body() for the text.
     body: str = ""
     references: List[str] = field(default_factory=list)
     owner: Optional[str] = None
+    # path relative to the context root, set by parse_document; None when path is outside root
+    rel_path: Optional[Path] = None
+
+    def __post_init__(self) -> None:
+        # Few distinct values, compared per document in manifest/validate loops: share one object each.
+        self.kind = sys.intern(self.kind)
+        if self.status is not None:
+            self.status = sys.intern(self.status)
+        if self.complexity is not None:
+            self.complexity = sys.intern(self.complexity)
+
+    def read_body(self) -> str:
+        """Body from disk; documents from build_index only read the frontmatter and keep body empty."""
+        return parse_frontmatter(self.path.read_text(encoding="utf-8"))[1]
 
     def to_metadata_dict(self, root: Path) -> Dict[str, Any]:
         """For manifest and adapter payload: id, kind, version, status, complexity, tags, path (relative)."""
-        rel_path = self.path.relative_to(root) if root in self.path.parents or self.path == root else self.path
+        rel_path = self.rel_path
+        if rel_path is None:
+            rel_path = self.path.relative_to(root) if root in self.path.parents or self.path == root else self.path
         return {
             "id": self.id,
             "kind": self.kind,
             "version": self.version,
             "status": self.status,
             "complexity": self.complexity,
-            "tags": self.tags,
+            "tags": list(self.tags),
             "path": str(rel_path),
         }
 
@@ -50,16 +80,13 @@ def parse_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
     content = content.strip()
     if not content.startswith(FRONTMATTER_DELIM):
         raise ValueError("Missing opening frontmatter delimiter ---")
-    rest = content[len(FRONTMATTER_DELIM) :].lstrip("\r\n")
-    idx = rest.find("\n" + FRONTMATTER_DELIM)
-    if idx == -1:
-        idx = rest.find("\r\n" + FRONTMATTER_DELIM)
-    if idx == -1:
+    m = _FRONTMATTER_RE.match(content)
+    if m is None:
         raise ValueError("Missing closing frontmatter delimiter ---")
-    fm_str = rest[:idx].strip()
-    body = rest[idx + 1 :].split(FRONTMATTER_DELIM, 1)[-1].lstrip("\r\n")
+    fm_str = m.group(2).strip()
+    body = m.group(3).lstrip("\r\n")
     try:
-        fm = yaml.safe_load(fm_str)
+        fm = yaml.load(fm_str, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in frontmatter: {e}") from e
     if fm is None:
@@ -69,6 +96,48 @@ def parse_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
     return fm, body
 
 
+def read_frontmatter_text(path: Path) -> str:
+    """
+    Read path only up to its closing frontmatter delimiter, in small chunks; the body is not read.
+    parse_frontmatter on the result gives the same frontmatter (and an empty body). Without a
+    closing delimiter the whole file is returned so parse_frontmatter reports the same error.
+    Each chunk is only searched for a new "\n---" (with a short overlap), so the read stays
+    linear even when the closing delimiter is missing.
+    """
+    parts: List[str] = []
+    size = 0
+    start = -1  # offset of the first non-whitespace character (where the opening --- must be)
+    opened = False
+    tail = ""
+    with open(path, encoding="utf-8") as f:
+        while True:
+            chunk = f.read(_READ_CHUNK)
+            if not chunk:
+                return "".join(parts)
+            parts.append(chunk)
+            size += len(chunk)
+            if start < 0:
+                stripped = chunk.lstrip()
+                if not stripped:
+                    continue
+                start = size - len(stripped)
+            if not opened:
+                if size - start < len(FRONTMATTER_DELIM):
+                    continue
+                text = "".join(parts)
+                if not text.startswith(FRONTMATTER_DELIM, start):
+                    return text
+                opened = True
+            window = tail + chunk
+            tail = window[-len(_CLOSE_MARK) + 1 :]
+            if _CLOSE_MARK not in window:
+                continue
+            head = "".join(parts)[start:]
+            m = _FRONTMATTER_RE.match(head)
+            if m is not None:
+                return head[: m.start(3)]
+
+
 def normalize_tags(v: Any) -> List[str]:
     if v is None:
         return []
@@ -110,6 +179,10 @@ def parse_document(file_path: Path, content: str, root: Path) -> Document:
     complexity = fm.get("complexity")
     references = normalize_tags(fm.get("references"))
     owner = fm.get("owner")
+    try:
+        rel_path: Optional[Path] = file_path.relative_to(root)
+    except ValueError:
+        rel_path = None
     return Document(
         path=file_path,
         id=str(doc_id).strip(),
@@ -122,6 +195,7 @@ def parse_document(file_path: Path, content: str, root: Path) -> Document:
         body=body,
         references=references,
         owner=str(owner).strip() if owner is not None else None,
+        rel_path=rel_path,
     )
 
 
@@ -158,7 +232,11 @@ def validate_document_schema(doc: Document) -> None:
             raise ValidationError(doc.path, "document must have id and kind")
 
 
+def normalize_content(raw_content: str) -> bytes:
+    """Deterministic representation for hashing: normalize line endings, strip, then UTF-8 bytes."""
+    return _EOL_RE.sub("\n", raw_content).strip().encode("utf-8")
+
+
 def normalized_content_for_checksum(doc: Document, raw_content: str) -> bytes:
-    """Deterministic representation for hashing: normalize line endings, then UTF-8 bytes."""
-    normalized = raw_content.replace("\r\n", "\n").replace("\r", "\n").strip()
-    return normalized.encode("utf-8")
+    """Deprecated, kept for existing callers: same as normalize_content(raw_content); doc is ignored."""
+    return normalize_content(raw_content)
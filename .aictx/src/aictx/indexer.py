@@ -1,15 +1,19 @@
 """Discovery and indexing: walk ai_context, collect rules and tasks, build document index."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from .document import Document, parse_document
+from .document import Document, parse_document, read_frontmatter_text
 from .config import RELATION_TYPES
 
 # Required artifacts by complexity (README)
 TRIVIAL_FILES = {"spec.md", "implementation.md"}
 NORMAL_FILES = {"spec.md", "plan.md", "implementation.md", "tests-review.md"}  # context optional, review short
 CRITICAL_FILES = {"spec.md", "context.md", "plan.md", "implementation.md", "review.md", "tests-review.md"}
+# Other known doc files indexed in a task dir besides spec.md
+TASK_DOC_FILES = ("context.md", "plan.md", "implementation.md", "review.md", "tests-review.md")
 
 
 def collect_rules(root: Path) -> List[Path]:
@@ -36,57 +40,79 @@ def required_files_for_complexity(complexity: Optional[str]) -> set:
     return NORMAL_FILES
 
 
+def _collect_index_jobs(root: Path) -> List[Tuple[Path, Optional[str], str]]:
+    """(path, index key or None to use doc.id, duplicate label) for every file to index, in index order."""
+    jobs: List[Tuple[Path, Optional[str], str]] = [(path, None, "id") for path in collect_rules(root)]
+    for task_dir in collect_task_dirs(root):
+        jobs.append((task_dir / "spec.md", f"{task_dir.name}-spec", "id"))
+        # Index other known doc files in task dir (context, plan, implementation, review, tests-review)
+        for name in TASK_DOC_FILES:
+            path = task_dir / name
+            if path.exists():
+                jobs.append((path, f"{task_dir.name}-{name.removesuffix('.md')}", "key"))
+    return jobs
+
+
+# root -> (stamp, index, errors) from the last build; see _index_stamp.
+_INDEX_CACHE: Dict[Path, Tuple[tuple, Dict[str, Document], List[str]]] = {}
+
+
+def _index_stamp(jobs: List[Tuple[Path, Optional[str], str]]) -> Optional[tuple]:
+    """(path, size, mtime_ns) of every file to index, in order; None if a file vanished mid-walk."""
+    stamp = []
+    try:
+        for path, _, _ in jobs:
+            st = os.stat(path)
+            stamp.append((path, st.st_size, st.st_mtime_ns))
+    except OSError:
+        return None
+    return tuple(stamp)
+
+
+def _parse_one(path: Path, root: Path) -> Document:
+    return parse_document(path, read_frontmatter_text(path), root)
+
+
 def build_index(root: Path) -> tuple[Dict[str, Document], List[str]]:
     """
     Build id -> Document index from root (ai_context). Also return list of validation errors.
     Does not validate schema or references; only collects and parses.
+    Only frontmatter is read (Document.body stays empty; see Document.read_body).
+    Files are read and parsed concurrently; results are merged in discovery order so
+    duplicate-id errors stay deterministic. The result is reused while no indexed file is
+    added, removed or changed (size/mtime); clear_index_cache() drops it. Each call returns a new
+    dict, but the Document objects are shared with the cache: treat them as read-only.
     """
+    jobs = _collect_index_jobs(root)
+    stamp = _index_stamp(jobs)
+    cached = _INDEX_CACHE.get(root)
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return dict(cached[1]), list(cached[2])
+
     index: Dict[str, Document] = {}
     errors: List[str] = []
-
-    for path in collect_rules(root):
+    with ThreadPoolExecutor() as pool:
+        futures = [pool.submit(_parse_one, path, root) for path, _, _ in jobs]
+    for (path, key, label), future in zip(jobs, futures):
         try:
-            content = path.read_text(encoding="utf-8")
-            doc = parse_document(path, content, root)
-            if doc.id in index:
-                errors.append(f"{path}: duplicate id {doc.id}")
-                continue
-            index[doc.id] = doc
+            doc = future.result()
         except Exception as e:
             errors.append(f"{path}: {e}")
+            continue
+        key = key or doc.id
+        if key in index:
+            errors.append(f"{path}: duplicate {label} {key}")
+            continue
+        index[key] = doc
+
+    if stamp is not None:
+        _INDEX_CACHE[root] = (stamp, dict(index), list(errors))
+    return index, errors
 
-    for task_dir in collect_task_dirs(root):
-        spec_path = task_dir / "spec.md"
-        spec_id = f"{task_dir.name}-spec"
-        try:
-            content = spec_path.read_text(encoding="utf-8")
-            doc = parse_document(spec_path, content, root)
-            if spec_id in index:
-                errors.append(f"{spec_path}: duplicate id {spec_id}")
-                continue
-            index[spec_id] = doc
-        except Exception as e:
-            errors.append(f"{spec_path}: {e}")
-
-        # Index other known doc files in task dir (context, plan, implementation, review, tests-review)
-        for name in ("context.md", "plan.md", "implementation.md", "review.md", "tests-review.md"):
-            if name == "spec.md":
-                continue
-            path = task_dir / name
-            if not path.exists():
-                continue
-            try:
-                content = path.read_text(encoding="utf-8")
-                sub_doc = parse_document(path, content, root)
-                composite_id = f"{task_dir.name}-{name.removesuffix('.md')}"
-                if composite_id in index:
-                    errors.append(f"{path}: duplicate key {composite_id}")
-                    continue
-                index[composite_id] = sub_doc
-            except Exception as e:
-                errors.append(f"{path}: {e}")
 
-    return index, errors
+def clear_index_cache() -> None:
+    """Forget memoized build_index results (e.g. after editing documents in tests)."""
+    _INDEX_CACHE.clear()
 
 
 def collect_relations(index: Dict[str, Document]) -> List[Dict[str, str]]:
@@ -0,0 +1,51 @@
+"""JSON (de)serialization: orjson when installed (optional, C speed), stdlib json otherwise. Same output either way."""
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency (pip install aictx[fast])
+    orjson = None
+
+_ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+# orjson is limited to 64-bit integers: it refuses to encode larger ones and decodes them as floats.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+
+def dumps(obj: Any, ensure_ascii: bool = False) -> str:
+    """
+    Pretty JSON (2-space indent), as json.dumps(obj, indent=2, ensure_ascii=ensure_ascii).
+    orjson cannot escape non-ASCII, so ensure_ascii=True always uses stdlib json.
+    """
+    if orjson is not None and not ensure_ascii:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS).decode("utf-8")
+        except orjson.JSONEncodeError:  # e.g. an integer beyond 64 bits; stdlib json handles it
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=ensure_ascii)
+
+
+def write(path: Path, obj: Any) -> None:
+    """Write dumps(obj) to path as UTF-8."""
+    if orjson is not None:
+        try:
+            path.write_bytes(orjson.dumps(obj, option=_ORJSON_OPTS))
+            return
+        except orjson.JSONEncodeError:
+            pass
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def load(path: Path) -> Any:
+    """Parse a UTF-8 JSON file."""
+    if orjson is not None:
+        data = path.read_bytes()
+        if not _LONG_DIGITS.search(data):
+            return orjson.loads(data)
+        return json.loads(data)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
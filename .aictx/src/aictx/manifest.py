@@ -1,129 +1,436 @@
-"""Build and write manifests.yaml; compute checksums; state for diff."""
+"""Build and write manifests.yaml; compute checksums (with an optional mtime/size cache); state for diff."""
 
 import hashlib
-from datetime import UTC, datetime
+import os
+import re
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
 
-from .document import Document, normalized_content_for_checksum
+import yaml
+
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
+    warnings.warn("PyYAML libyaml bindings not available; manifest YAML I/O uses the slower pure-Python codec")
+
+try:
+    import msgpack
+except ImportError:  # optional dependency (pip install aictx[fast])
+    msgpack = None
+
+from .document import Document, normalize_content
 from .indexer import collect_relations
 
 GENERATOR = "aictx 1.0"
+# Persisted in manifests.yaml, state and adapter context.json; changing it invalidates every stored checksum.
+CHECKSUM_PREFIX = "sha256:"
+_HASH_CHUNK = 1 << 16
+# Task docs other than spec; they count towards the root checksum only while their task's spec is active.
+TASK_DOC_KINDS = frozenset(("context", "plan", "implementation", "review", "tests-review"))
+
+
+def _digest(normalized: bytes) -> str:
+    """Checksum string for already-normalized bytes; the single place that picks the algorithm."""
+    return CHECKSUM_PREFIX + hashlib.sha256(normalized).hexdigest()
+
+
+def _normalize_chunks(f: TextIO, chunk: int = _HASH_CHUNK) -> Iterator[str]:
+    """
+    Yield the text of f (opened with universal newlines, so CRLF/CR already read as LF) with
+    leading/trailing whitespace dropped exactly like str.strip(), one chunk at a time. A whitespace
+    run is held back until non-whitespace follows it, so the tail never needs the whole file.
+    """
+    pending = ""
+    started = False
+    while True:
+        text = f.read(chunk)
+        if not text:
+            return
+        if not started:
+            text = text.lstrip()
+            if not text:
+                continue
+            started = True
+        body = text.rstrip()
+        if body:
+            if pending:
+                yield pending
+            yield body
+            pending = text[len(body) :]
+        else:
+            pending += text
+
+
+class _BufferedHasher:
+    """SHA-256 fed in blocks of at least _HASH_CHUNK bytes; small pieces are coalesced before update()."""
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self._buf = bytearray()
+
+    def update(self, data: bytes) -> None:
+        if not self._buf and len(data) >= _HASH_CHUNK:
+            self._hash.update(data)
+            return
+        self._buf += data
+        if len(self._buf) >= _HASH_CHUNK:
+            self._hash.update(self._buf)
+            self._buf.clear()
+
+    def hexdigest(self) -> str:
+        if self._buf:
+            self._hash.update(self._buf)
+            self._buf.clear()
+        return self._hash.hexdigest()
 
 
 def file_checksum(path: Path) -> str:
-    """SHA-256 of file content (normalized line endings)."""
-    raw = path.read_bytes()
-    normalized = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n").strip()
-    return "sha256:" + hashlib.sha256(normalized).hexdigest()
+    """
+    SHA-256 of file content (normalized line endings), streamed; equal to content_checksum of the text.
+    Raises ValueError("path: reason") if the file is not valid UTF-8 (validate only decodes frontmatter).
+    """
+    h = _BufferedHasher()
+    try:
+        with open(path, encoding="utf-8") as f:
+            for text in _normalize_chunks(f):
+                h.update(text.encode("utf-8"))
+    except UnicodeDecodeError as e:
+        raise ValueError(f"{path}: {e}") from e
+    return CHECKSUM_PREFIX + h.hexdigest()
 
 
 def content_checksum(raw_content: str) -> str:
     """SHA-256 of normalized content string."""
-    normalized = raw_content.replace("\r\n", "\n").replace("\r", "\n").strip()
-    return "sha256:" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return _digest(normalize_content(raw_content))
+
+
+def load_checksum_cache(aictx_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Load .aictx/cache/checksums.yaml (path -> size, mtime_ns, dev, ino, checksum); empty if missing or unreadable."""
+    path = aictx_dir / "cache" / "checksums.yaml"
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_Loader)
+    except (OSError, yaml.YAMLError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_checksum_cache(aictx_dir: Path, cache: Dict[str, Dict[str, Any]]) -> None:
+    """Write the checksum cache to .aictx/cache/checksums.yaml (performance only; safe to delete)."""
+    cache_dir = aictx_dir / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_dir / "checksums.yaml", "w", encoding="utf-8") as f:
+        yaml.dump(cache, f, default_flow_style=False, allow_unicode=True, sort_keys=True, Dumper=_Dumper)
+
+
+def _cache_entry(st: os.stat_result, checksum: str) -> Dict[str, Any]:
+    """Checksum cache entry; dev/ino let a renamed (same inode, size, mtime) file keep its checksum."""
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "dev": st.st_dev, "ino": st.st_ino, "checksum": checksum}
+
+
+def _checksums_by_inode(cache: Dict[str, Dict[str, Any]]) -> Dict[tuple, str]:
+    """(dev, ino, size, mtime_ns) -> checksum for cache entries that record an inode."""
+    by_inode = {}
+    for entry in cache.values():
+        if isinstance(entry, dict) and entry.get("ino") and isinstance(entry.get("checksum"), str):
+            by_inode[(entry.get("dev"), entry["ino"], entry.get("size"), entry.get("mtime_ns"))] = entry["checksum"]
+    return by_inode
+
+
+def _cache_miss(path: Path, st: os.stat_result, cache: Dict[str, Dict[str, Any]]) -> bool:
+    """True unless cache holds a checksum for path recorded at st's size and mtime_ns."""
+    entry = cache.get(str(path))
+    return not (
+        isinstance(entry, dict)
+        and entry.get("size") == st.st_size
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and isinstance(entry.get("checksum"), str)
+    )
+
+
+def cached_file_checksum(path: Path, st: os.stat_result, cache: Dict[str, Dict[str, Any]]) -> str:
+    """file_checksum of path, taken from cache when size and mtime_ns match st; records the result in cache."""
+    key = str(path)
+    if not _cache_miss(path, st, cache):
+        return cache[key]["checksum"]
+    checksum = file_checksum(path)
+    cache[key] = _cache_entry(st, checksum)
+    return checksum
+
 
+def file_checksums(paths: Iterable[Path]) -> List[str]:
+    """file_checksum of each path, in order. Reads and hashes overlap across threads (hashlib releases the GIL)."""
+    paths = list(paths)
+    if len(paths) < 2:
+        return [file_checksum(p) for p in paths]
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(file_checksum, paths))
 
-def aggregated_checksum(index: Dict[str, Document], root: Path, read_mode: str = "active") -> str:
+
+def _set_element(doc_id: str, checksum: str) -> int:
+    """One document's contribution to the set hash: sha256(id NUL content digest) as an int."""
+    digest = bytes.fromhex(checksum[len(CHECKSUM_PREFIX) :])
+    return int.from_bytes(hashlib.sha256(doc_id.encode("utf-8") + b"\0" + digest).digest(), "big")
+
+
+def aggregated_checksum(
+    index: Dict[str, Document],
+    root: Optional[Path] = None,
+    read_mode: str = "active",
+    checksums: Optional[Dict[str, str]] = None,
+) -> str:
     """
-    Deterministic: only documents eligible under read_mode (default active), sort by id, hash each.
+    Deterministic set hash over documents eligible under read_mode (default active): XOR of
+    sha256(doc_id NUL sha256(normalized content)) per document. XOR is order-independent, so no
+    sort is needed, and one document's change is an O(1) update. checksums (doc_id -> content
+    checksum, e.g. from build_manifest) avoids re-reading files; missing ids are hashed from disk.
+    root is unused (documents carry absolute paths); kept so existing positional calls still work.
     Rules are always included; task docs (spec, context, plan, ...) only when spec is active.
     """
     active_spec_ids = set()
-    for doc_id, doc in index.items():
-        if doc.kind == "spec" and doc.status == "active":
-            # Task id from doc_id (e.g. TASK-123-spec -> TASK-123)
-            task_id = doc_id.replace("-spec", "", 1) if doc_id.endswith("-spec") else doc_id
-            active_spec_ids.add(task_id)
     eligible = []
+    # Task docs wait for active_spec_ids to be complete; their task id (parent dir name) is taken once here.
+    task_docs = []
     for doc_id, doc in index.items():
-        if doc.kind == "rule":
+        kind = doc.kind
+        if kind == "rule":
             eligible.append((doc_id, doc))
-            continue
-        if doc.kind == "spec":
-            if read_mode == "active" and doc.status != "active":
+        elif kind == "spec":
+            if doc.status == "active":
+                # Task id from doc_id (e.g. TASK-123-spec -> TASK-123)
+                active_spec_ids.add(doc_id.replace("-spec", "", 1) if doc_id.endswith("-spec") else doc_id)
+            elif read_mode == "active":
                 continue
             eligible.append((doc_id, doc))
-            continue
-        # Task doc (context, plan, etc.): include if its task spec is active
-        if doc.kind in ("context", "plan", "implementation", "review", "tests-review"):
-            task_id = doc.path.parent.name if (doc.path.parent.name and doc.path.parent.name != "tasks") else None
-            if task_id and task_id in active_spec_ids:
-                eligible.append((doc_id, doc))
-            elif read_mode != "active":
-                eligible.append((doc_id, doc))
-    eligible.sort(key=lambda x: x[0])
-    h = hashlib.sha256()
-    for doc_id, doc in eligible:
-        raw = doc.path.read_text(encoding="utf-8")
-        h.update(normalized_content_for_checksum(doc, raw))
-    return "sha256:" + h.hexdigest()
+        elif kind in TASK_DOC_KINDS:
+            parent_name = doc.path.parent.name
+            task_docs.append((doc_id, doc, parent_name if parent_name and parent_name != "tasks" else None))
+    # Task doc (context, plan, etc.): include if its task spec is active
+    for doc_id, doc, task_id in task_docs:
+        if (task_id and task_id in active_spec_ids) or read_mode != "active":
+            eligible.append((doc_id, doc))
+    known = checksums if checksums is not None else {}
+    missing = [(doc_id, doc) for doc_id, doc in eligible if known.get(doc_id) is None]
+    hashed = dict(zip((doc_id for doc_id, _ in missing), file_checksums(doc.path for _, doc in missing)))
+    acc = 0
+    for doc_id, _ in eligible:
+        checksum = known.get(doc_id)
+        acc ^= _set_element(doc_id, checksum if checksum is not None else hashed[doc_id])
+    return CHECKSUM_PREFIX + acc.to_bytes(32, "big").hex()
 
 
 def build_manifest(
     root: Path,
     index: Dict[str, Document],
     convention_version: str = "0.0.1",
+    checksum_cache: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
-    """Build manifest dict (documents, active_set, relations, root_checksum)."""
+    """
+    Build manifest dict (documents, active_set, relations, root_checksum).
+    If checksum_cache is given (see load_checksum_cache), unchanged documents are not re-read; on return it
+    holds exactly the current documents' entries.
+    """
     relations = collect_relations(index)
-    root_checksum = aggregated_checksum(index, root, "active")
+    previous_checksums = checksum_cache if checksum_cache is not None else {}
+    current_checksums: Dict[str, Dict[str, Any]] = {}
+    items = sorted(index.items())
+    doc_stats = []
+    for doc_id, doc in items:
+        st = doc.path.stat()
+        doc_stats.append(st)
+        key = str(doc.path)
+        if key in previous_checksums:
+            current_checksums[key] = previous_checksums[key]
+    # Cache misses are hashed up front in parallel; the loop below then only takes cache hits.
+    misses = []
+    by_inode = None
+    for (_, doc), st in zip(items, doc_stats):
+        if not _cache_miss(doc.path, st, current_checksums):
+            continue
+        # A path miss may be a moved/renamed file: same inode, size and mtime as a cached entry.
+        if by_inode is None:
+            by_inode = _checksums_by_inode(previous_checksums)
+        moved = by_inode.get((st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)) if st.st_ino else None
+        if moved is not None:
+            current_checksums[str(doc.path)] = _cache_entry(st, moved)
+        else:
+            misses.append((doc.path, st))
+    for (path, st), checksum in zip(misses, file_checksums(path for path, _ in misses)):
+        current_checksums[str(path)] = _cache_entry(st, checksum)
+    if checksum_cache is not None:
+        checksum_cache.clear()
+        checksum_cache.update(current_checksums)
+    checksums: Dict[str, str] = {}
     documents = []
     active_set = []
-    for doc_id, doc in sorted(index.items()):
-        raw = doc.path.read_text(encoding="utf-8")
-        checksum = content_checksum(raw)
-        # Status/complexity from doc (for spec they're set; for rule status may be missing)
-        status = getattr(doc, "status", None)
-        complexity = getattr(doc, "complexity", None)
-        rel_path = doc.path.relative_to(root) if root in doc.path.parents or doc.path == root else doc.path
-        entry = {
+    for (doc_id, doc), st in zip(items, doc_stats):
+        checksum = cached_file_checksum(doc.path, st, current_checksums)
+        checksums[doc_id] = checksum
+        documents.append({
             "id": doc_id,
             "kind": doc.kind,
-            "path": str(rel_path),
+            "path": str(doc.rel_path or doc.path),
             "version": doc.version,
-            "status": status,
-            "complexity": complexity,
+            # Document defaults both to None (e.g. rules usually have neither)
+            "status": doc.status,
+            "complexity": doc.complexity,
             "checksum": checksum,
-            "tags": doc.tags or [],
-        }
-        documents.append(entry)
-        if status == "active":
+            "tags": list(doc.tags) if doc.tags else [],
+        })
+        if doc.status == "active":
             active_set.append(doc_id)
     return {
         "convention_version": convention_version,
-        "generated_at": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "generator": GENERATOR,
-        "root_checksum": root_checksum,
+        "root_checksum": aggregated_checksum(index, root, "active", checksums),
         "documents": documents,
         "active_set": active_set,
         "relations": relations,
     }
 
 
+# Plain (unquoted) candidates: word chars and . / + - in space-separated runs; ":" only before another such char.
+_PLAIN_RE = re.compile(r"[\w/](?:[\w./+-]|:(?=[\w./+-]))*(?: (?:[\w./+-]|:(?=[\w./+-]))+)*\Z")
+_RESOLVER = yaml.resolver.Resolver()
+_STR_TAG = "tag:yaml.org,2002:str"
+_ESCAPES = {"\0": "\\0", "\a": "\\a", "\b": "\\b", "\t": "\\t", "\n": "\\n", "\v": "\\v", "\f": "\\f",
+            "\r": "\\r", "\x1b": "\\e", '"': '\\"', "\\": "\\\\"}
+
+
+def _emit_scalar(value: Any) -> str:
+    """YAML text for a scalar; strings are plain when safe and unambiguous, else single- or double-quoted."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        # Rare here; let PyYAML pick the canonical spelling (.inf, .nan, 1.0e+20, ...).
+        return yaml.dump(value, Dumper=_Dumper).split("\n", 1)[0]
+    if not isinstance(value, str):
+        raise TypeError(f"Cannot emit {type(value).__name__} in manifest YAML")
+    if _PLAIN_RE.match(value) and _RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == _STR_TAG:
+        return value
+    if value.isprintable():
+        return "'" + value.replace("'", "''") + "'"
+    out = []
+    for ch in value:
+        if ch in _ESCAPES:
+            out.append(_ESCAPES[ch])
+        elif ch.isprintable():
+            out.append(ch)
+        elif ord(ch) <= 0xFF:
+            out.append(f"\\x{ord(ch):02X}")
+        elif ord(ch) <= 0xFFFF:
+            out.append(f"\\u{ord(ch):04X}")
+        else:
+            out.append(f"\\U{ord(ch):08X}")
+    return '"' + "".join(out) + '"'
+
+
+def _emit_node(out: List[str], value: Any, indent: int) -> None:
+    """Append block YAML lines for a non-empty mapping or list at indent, laid out like PyYAML (indentless lists)."""
+    pad = " " * indent
+    if isinstance(value, dict):
+        for key, item in value.items():
+            k = _emit_scalar(key)
+            if isinstance(item, dict) and item:
+                out.append(f"{pad}{k}:\n")
+                _emit_node(out, item, indent + 2)
+            elif isinstance(item, list) and item:
+                out.append(f"{pad}{k}:\n")
+                _emit_node(out, item, indent)
+            else:
+                out.append(f"{pad}{k}: {_emit_flat(item)}\n")
+        return
+    for item in value:
+        if isinstance(item, (dict, list)) and item:
+            nested: List[str] = []
+            _emit_node(nested, item, indent + 2)
+            nested[0] = f"{pad}- {nested[0][indent + 2:]}"
+            out.extend(nested)
+        else:
+            out.append(f"{pad}- {_emit_flat(item)}\n")
+
+
+def _emit_flat(value: Any) -> str:
+    if isinstance(value, dict):
+        return "{}"
+    if isinstance(value, list):
+        return "[]"
+    return _emit_scalar(value)
+
+
+def _dump_manifest(f: TextIO, manifest: Dict[str, Any]) -> None:
+    """
+    Write manifest with a small emitter for the fixed manifest/state shape (mappings, lists, scalars);
+    the result loads back to the same data, and for ordinary manifests (ids, paths, checksums, tags) is
+    byte-identical to yaml.dump(sort_keys=False, allow_unicode=True). Strings needing escapes or line
+    folding may be quoted differently from PyYAML; see tests/test_manifest_yaml.py.
+    """
+    for key, value in manifest.items():
+        out: List[str] = []
+        _emit_node(out, {key: value}, 0)
+        f.write("".join(out))
+
+
 def write_manifest(root: Path, manifest: Dict[str, Any]) -> None:
     """Write manifest as YAML to root/manifests.yaml."""
-    import yaml
     path = root / "manifests.yaml"
     with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(manifest, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        _dump_manifest(f, manifest)
+
+
+def _state_cache_path(aictx_dir: Path) -> Path:
+    return aictx_dir / "cache" / "last_manifest.mp"
 
 
 def save_state(aictx_dir: Path, manifest: Dict[str, Any]) -> None:
-    """Save last built manifest to .aictx/state/ for diff."""
-    import yaml
+    """
+    Save last built manifest to .aictx/state/last_manifest.yaml for diff. When msgpack is installed, a copy also goes to .aictx/cache/last_manifest.mp,
+    tagged with the YAML file's size/mtime, so load_last_manifest can skip the YAML parse (performance only).
+    """
     state_dir = aictx_dir / "state"
     state_dir.mkdir(parents=True, exist_ok=True)
     path = state_dir / "last_manifest.yaml"
     with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(manifest, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        _dump_manifest(f, manifest)
+    if msgpack is not None:
+        st = path.stat()
+        cache_path = _state_cache_path(aictx_dir)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            msgpack.pack({"yaml": [st.st_size, st.st_mtime_ns], "manifest": manifest}, f, use_bin_type=True)
+
+
+def _load_state_cache(aictx_dir: Path, st: os.stat_result) -> Dict[str, Any] | None:
+    """Manifest from cache/last_manifest.mp if it was written for the YAML state with stat st; else None."""
+    try:
+        with open(_state_cache_path(aictx_dir), "rb") as f:
+            data = msgpack.unpack(f, raw=False)
+    except Exception:  # missing, truncated or corrupt: the YAML state is authoritative
+        return None
+    if not isinstance(data, dict) or data.get("yaml") != [st.st_size, st.st_mtime_ns]:
+        return None
+    manifest = data.get("manifest")
+    return manifest if isinstance(manifest, dict) else None
 
 
 def load_last_manifest(aictx_dir: Path) -> Dict[str, Any] | None:
     """Load last built manifest from .aictx/state/; None if missing."""
-    import yaml
     path = aictx_dir / "state" / "last_manifest.yaml"
     if not path.exists():
         return None
+    if msgpack is not None:
+        manifest = _load_state_cache(aictx_dir, path.stat())
+        if manifest is not None:
+            return manifest
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_Loader)
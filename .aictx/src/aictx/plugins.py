@@ -1,7 +1,9 @@
 """Lifecycle hooks: load plugins from .aictx/plugins/ and invoke before/after events."""
 
+import importlib.util
+import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Tuple
 
 HOOKS = (
     "before_validate",
@@ -12,16 +14,22 @@ HOOKS = (
     "after_export",
 )
 
-_registry: Dict[str, List[Callable[..., None]]] = {h: [] for h in HOOKS}
+# Tuples, rebuilt on register, so emit iterates without copying; _HAS_ANY lets emit skip the lookup entirely.
+_registry: Dict[str, Tuple[Callable[..., None], ...]] = {h: () for h in HOOKS}
+_HAS_ANY = False
 
 
 def register(hook: str, fn: Callable[..., None]) -> None:
+    global _HAS_ANY
     if hook not in HOOKS:
         raise ValueError(f"Unknown hook: {hook}")
-    _registry[hook].append(fn)
+    _registry[hook] = _registry[hook] + (fn,)
+    _HAS_ANY = True
 
 
 def emit(hook: str, **context: Any) -> None:
+    if not _HAS_ANY:
+        return
     for fn in _registry[hook]:
         try:
             fn(**context)
@@ -33,8 +41,6 @@ def load_plugins_from_dir(plugins_dir: Path) -> None:
     """Load Python modules from plugins_dir and register their hooks. Optional."""
     if not plugins_dir.is_dir():
         return
-    import importlib.util
-    import sys
     for path in plugins_dir.glob("*.py"):
         if path.name.startswith("_"):
             continue
@@ -1,7 +1,8 @@
 """Validate: required files, frontmatter, schema, references, enums. Fail fast."""
 
+import os
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, List, Tuple
 
 from .document import Document, ValidationError, validate_document_schema
 from .indexer import (
@@ -12,6 +13,11 @@ from .indexer import (
 from .config import RELATION_TYPES
 
 
+def valid_reference_ids(index: Dict[str, Document]) -> FrozenSet[str]:
+    """Every id a reference may name: index keys plus task ids (X for each X-spec key)."""
+    return frozenset(index).union(k[: -len("-spec")] for k in index if k.endswith("-spec"))
+
+
 def ref_exists(ref_id: str, index: Dict[str, Document]) -> bool:
     """True if ref_id is an index key or a task id (ref_id-spec in index)."""
     if ref_id in index:
@@ -32,10 +38,14 @@ def validate_required_files(root: Path, index: Dict[str, Document]) -> List[str]
         spec_doc = index.get(spec_id)
         if not spec_doc:
             continue
-        complexity = getattr(spec_doc, "complexity", None) or "normal"
+        complexity = spec_doc.complexity or "normal"
         required = required_files_for_complexity(complexity)
+        # One listing instead of a stat per required file; dangling symlinks do not count as present
+        # (as with exists()), and a name missing from the listing is re-checked for case-insensitive filesystems.
+        with os.scandir(task_dir) as entries:
+            present = {e.name for e in entries if not e.is_symlink() or os.path.exists(e.path)}
         for f in required:
-            if not (task_dir / f).exists():
+            if f not in present and not (task_dir / f).exists():
                 errors.append(f"{task_dir / f}: required file missing (complexity={complexity})")
     return errors
 
@@ -43,9 +53,11 @@ def validate_required_files(root: Path, index: Dict[str, Document]) -> List[str]
 def validate_references(index: Dict[str, Document]) -> List[str]:
     """Each reference must point to an existing document id."""
     errors = []
+    # Same test as ref_exists, against ids collected once instead of two probes and an f-string per reference.
+    valid_ids = valid_reference_ids(index)
     for doc_id, doc in index.items():
         for ref_id in doc.references:
-            if not ref_exists(ref_id, index):
+            if ref_id not in valid_ids:
                 errors.append(f"{doc.path}: reference to unknown id {ref_id}")
     return errors
 
@@ -0,0 +1,101 @@
+"""Manifest/state YAML emitter (manifest._dump_manifest) against PyYAML."""
+
+import io
+
+import pytest
+import yaml
+
+from aictx.manifest import _Dumper, _Loader, _dump_manifest
+
+# Shape written by build-manifest / save_state: header scalars, documents, active_set, relations.
+FIXTURE_MANIFEST = {
+    "convention_version": "0.0.2",
+    "generated_at": "2026-01-02T03:04:05Z",
+    "generator": "aictx 1.0",
+    "root_checksum": "sha256:23ac15bff1a2a5582de10b33094c080da1e70980f98c77e6e82571b97b3d12c4",
+    "documents": [
+        {
+            "id": "TASK-1-implementation",
+            "kind": "implementation",
+            "path": "tasks/TASK-1/implementation.md",
+            "version": 1,
+            "status": None,
+            "complexity": None,
+            "checksum": "sha256:009a3c7101cbad9e195d408cd7f09314a201626d3c761b031dabba8b406111b7",
+            "tags": [],
+        },
+        {
+            "id": "TASK-1-spec",
+            "kind": "spec",
+            "path": "tasks/TASK-1/spec.md",
+            "version": 1,
+            "status": "active",
+            "complexity": "trivial",
+            "checksum": "sha256:7af0469082a2f63ad08ad4bf8af599067a0b39ac9ab64f9881d1863ea7ed3f49",
+            "tags": ["backend", "yes", "2024", "null", "v1.2", "c++", "a: b", "#x", "über"],
+        },
+        {
+            "id": "rule-a",
+            "kind": "rule",
+            "path": "rules/security.rule.md",
+            "version": 2,
+            "status": None,
+            "complexity": None,
+            "checksum": "sha256:0e5751c026e543b2e8ab2eb06099daa1d1e5df47778f7787faab45cdf12fe3a8",
+            "tags": ["x", "y"],
+        },
+    ],
+    "active_set": ["TASK-1-spec"],
+    "relations": [
+        {"from": "TASK-1-spec", "to": "rule-a", "type": "uses"},
+        {"from": "rule-b", "to": "TASK-1", "type": "uses"},
+    ],
+}
+
+# Strings whose plain form would resolve to another type or break YAML syntax, plus escapes and non-ASCII.
+QUOTING_SENSITIVE = [
+    "", " ", " lead", "trail ", "a  b",
+    "yes", "no", "on", "off", "y", "n", "True", "NULL", "null", "Null", "~",
+    "123", "-1", "+1", "1_000", "1.5", "1e3", ".inf", ".nan", "0x1F", "0o17",
+    "2024-01-01", "2024-01-01T10:00:00Z",
+    "a: b", "key:", ":", "x:y", "a #b", "#x", "- x", "-", "?", "=", "<<",
+    "*x", "&x", "!x", "@x", "`x", "%x", ">x", "x|y", "a,b", "[x]", "{x}",
+    "'q'", '"d"', "it's",
+    "tab\there", "line\nbreak", "a\rb", "\x00ctl", "\x7f", "\x85", "\u2028", "\ufeffbom",
+    "é unicode", "日本語", "x" * 100, " ".join(["word"] * 30),
+    "TASK-1-spec", "rules/a.md", "sha256:abc",
+]
+
+
+def _emit(data):
+    f = io.StringIO()
+    _dump_manifest(f, data)
+    return f.getvalue()
+
+
+def test_fixture_manifest_matches_yaml_dump():
+    expected = yaml.dump(
+        FIXTURE_MANIFEST, Dumper=_Dumper, default_flow_style=False, allow_unicode=True, sort_keys=False
+    )
+    assert _emit(FIXTURE_MANIFEST) == expected
+
+
+def test_fixture_manifest_round_trips():
+    assert yaml.load(_emit(FIXTURE_MANIFEST), Loader=_Loader) == FIXTURE_MANIFEST
+
+
+@pytest.mark.parametrize("value", QUOTING_SENSITIVE)
+def test_quoting_sensitive_strings_round_trip(value):
+    data = {"scalar": value, "items": [value, {"id": value}], "mapping": {value: value}}
+    assert yaml.load(_emit(data), Loader=_Loader) == data
+
+
+@pytest.mark.parametrize("value", [None, True, False, 0, -7, 2**63, [], {}])
+def test_non_string_scalars_round_trip(value):
+    data = {"value": value, "items": [value]}
+    assert yaml.load(_emit(data), Loader=_Loader) == data
+
+
+def test_unsupported_type_is_rejected():
+    with pytest.raises(TypeError):
+        _emit({"value": object()})